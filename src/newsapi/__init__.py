@@ -8,8 +8,6 @@ KEYS = {
     "NEWSAPI_URL": ("NewsAPI URL is required. Set `NEWSAPI_URL` environment variable."),
 }
 
-for key, msg in KEYS.items():
-    try:
-        _ = os.environ[key]
-    except KeyError:
-        raise ValueError(msg)
+_missing = [key for key in KEYS if not os.environ.get(key)]
+if _missing:
+    raise ValueError(" ".join(KEYS[key] for key in _missing))
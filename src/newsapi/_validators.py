@@ -0,0 +1,32 @@
+import re
+from typing import Optional
+
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+VALID_SORT = frozenset(("relevancy", "popularity", "publishedAt"))
+VALID_CATEGORY = frozenset(
+    (
+        "business",
+        "entertainment",
+        "general",
+        "health",
+        "science",
+        "sports",
+        "technology",
+    )
+)
+
+
+def is_valid_date(date_str: Optional[str]) -> bool:
+    """
+    Validate that a string is in YYYY-MM-DD format.
+    """
+    if date_str is None:
+        return True
+
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
+        return False
+
+    _, month, day = map(int, match.groups())
+    return 1 <= month <= 12 and 1 <= day <= 31
@@ -1,85 +1,357 @@
+import asyncio
+import math
 import os
 import httpx
+import ijson
+import orjson
+from cachetools import TTLCache
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union, Tuple, cast
+from functools import partial
+from typing import Any, AsyncIterator, Dict, FrozenSet
+from pydantic import TypeAdapter
 from .models import NewsResponse, Article, ArticleSource
 
+_MAX_CONCURRENT_PAGES = 10
+_STREAM_PAGE_SIZE = 50
+
+# Parses publishedAt on the unvalidated path exactly as model_validate would.
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+# Request parameters as documented for each NewsAPI endpoint. Cache keys list their
+# values in the (per-process stable) iteration order of these sets.
+_EVERYTHING_KEYS = frozenset(
+    (
+        "q",
+        "searchIn",
+        "sources",
+        "domains",
+        "excludeDomains",
+        "from",
+        "to",
+        "language",
+        "sortBy",
+        "pageSize",
+        "page",
+    )
+)
+_TOP_HEADLINES_KEYS = frozenset(
+    ("q", "country", "category", "sources", "pageSize", "page")
+)
+
+
+class NewsAPIError(Exception):
+    """Raised when a NewsAPI request fails or its response cannot be parsed."""
+
 
 class NewsAPIConnector:
     """
     Handles a connection with the NewsAPI and retrieves news articles.
+
+    Successful NewsAPI payloads are trusted and built without validation unless
+    the connector is created with strict=True.
     """
 
-    def __init__(self):
+    def __init__(self, strict: bool = False):
         self.api_key = os.getenv("NEWSAPI_KEY")
         self.base_url = os.getenv("NEWSAPI_URL")
+        self._everything_url = "everything"
+        self._top_headlines_url = "top-headlines"
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=30.0,
+            headers={"X-Api-Key": self.api_key, "Accept-Encoding": "br, gzip"},
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=True,
+        )
+        self._cache: TTLCache = TTLCache(maxsize=256, ttl=60)
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self.strict = strict
 
-    async def get_client(self) -> httpx.AsyncClient:
+    async def close(self) -> None:
         """
-        Creates and returns an httpx client configured for NewsAPI.
-
-        Returns:
-            An httpx.AsyncClient with proper headers and timeouts.
+        Closes the underlying httpx client and its pooled connections.
         """
-        return httpx.AsyncClient(timeout=30.0, headers={"X-Api-Key": self.api_key})
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "NewsAPIConnector":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
     async def search_everything(
-        self, **kwargs
-    ) -> Tuple[bool, Union[str, NewsResponse]]:
+        self, *, use_cache: bool = True, **kwargs
+    ) -> NewsResponse:
         """
         Retrieves News Articles from the NewsAPI "/everything" endpoint.
 
         Args:
+            use_cache: Whether to serve identical queries from the TTL cache (default: True)
             **kwargs: Requests parameters as defined in https://newsapi.org/docs/endpoints/everything
 
         Returns:
-            A tuple containing (success, result) where:
-            - success: A boolean indicating if the request was successful
-            - result: Either an error message (string) or the validated NewsResponse model
-        """
-        async with await self.get_client() as client:
-            params = kwargs
-            try:
-                response = await client.get(f"{self.base_url}everything", params=params)
-                response.raise_for_status()
-                data = response.json()
-                result = NewsResponse.model_validate(data)
+            The NewsResponse model
+
+        Raises:
+            NewsAPIError: If the request fails or the response cannot be parsed
+        """
+        return await self._fetch(
+            self._everything_url, kwargs, _EVERYTHING_KEYS, use_cache
+        )
+
+    async def search_everything_paged(
+        self, *, max_results: int, **kwargs
+    ) -> NewsResponse:
+        """
+        Retrieves up to max_results News Articles from the NewsAPI "/everything" endpoint,
+        fetching the pages after the first one concurrently.
+
+        Args:
+            max_results: Maximum number of articles to retrieve across all pages
+            **kwargs: Requests parameters as defined in https://newsapi.org/docs/endpoints/everything
 
-                return True, result
+        Returns:
+            A NewsResponse with the merged articles
+
+        Raises:
+            NewsAPIError: If pageSize is not a positive integer or any of the page requests fails
+        """
+        try:
+            page_size = int(kwargs.get("pageSize", 100))
+        except (TypeError, ValueError) as e:
+            raise NewsAPIError(f"Invalid pageSize: {kwargs['pageSize']!r}") from e
+        if page_size < 1:
+            raise NewsAPIError(f"Invalid pageSize: {page_size}. Must be at least 1.")
+
+        kwargs["pageSize"] = page_size
+        kwargs.pop("page", None)
+
+        first = await self.search_everything(page=1, **kwargs)
 
-            except httpx.RequestError as e:
-                return False, f"Request error: {str(e)}"
+        pages = math.ceil(min(max_results, first.totalResults) / page_size)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
 
-            except Exception as e:
-                return False, f"Unexpected error: {str(e)}"
+        async def fetch_page(page: int) -> NewsResponse:
+            async with semaphore:
+                return await self.search_everything(page=page, **kwargs)
+
+        results = await asyncio.gather(*(fetch_page(p) for p in range(2, pages + 1)))
+
+        articles = list(first.articles)
+        for result in results:
+            articles.extend(result.articles)
+
+        return NewsResponse(
+            status=first.status,
+            totalResults=first.totalResults,
+            articles=articles[:max_results],
+        )
 
     async def get_top_headlines(
-        self, **kwargs
-    ) -> Tuple[bool, Union[str, NewsResponse]]:
+        self, *, use_cache: bool = True, **kwargs
+    ) -> NewsResponse:
         """
         Retrieves Top-Headlines Articles from the NewsAPI "/top-headlines" endpoint.
 
         Args:
+            use_cache: Whether to serve identical queries from the TTL cache (default: True)
             **kwargs: Requests parameters as defined in https://newsapi.org/docs/endpoints/top-headlines
 
         Returns:
-            A tuple containing (success, result) where:
-            - success: A boolean indicating if the request was successful
-            - result: Either an error message (string) or the validated NewsResponse model
-        """
-        async with await self.get_client() as client:
-            params = kwargs
-            try:
-                response = await client.get(
-                    f"{self.base_url}top-headlines", params=params
-                )
+            The NewsResponse model
+
+        Raises:
+            NewsAPIError: If the request fails or the response cannot be parsed
+        """
+        return await self._fetch(
+            self._top_headlines_url, kwargs, _TOP_HEADLINES_KEYS, use_cache
+        )
+
+    async def _fetch(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        keys: FrozenSet[str],
+        use_cache: bool,
+    ) -> NewsResponse:
+        """
+        Returns the response for a NewsAPI query, served from the TTL cache when possible.
+        Concurrent identical queries share a single in-flight request.
+        """
+        # httpx sends None values as empty parameters; drop them so that omitting a
+        # parameter and passing None make the same request and share a cache key.
+        params = {k: v for k, v in params.items() if v is not None}
+        if not use_cache:
+            return await self._request(url, params)
+
+        key = _cache_key(url, keys, params)
+        try:
+            cached = self._cache.get(key)
+        except TypeError:
+            # Unhashable values (e.g. list-valued params) are requested without caching.
+            return await self._request(url, params)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_and_cache(key, url, params))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._inflight_done, key))
+
+        # The request runs in its own task, so cancelling one caller never cancels
+        # the request the other callers are waiting on.
+        return await asyncio.shield(task)
+
+    async def _request_and_cache(
+        self, key: tuple, url: str, params: Dict[str, Any]
+    ) -> NewsResponse:
+        """
+        Performs the request for an in-flight query and caches the successful response.
+        """
+        result = await self._request(url, params)
+        self._cache[key] = result
+        return result
+
+    def _inflight_done(self, key: tuple, task: asyncio.Task) -> None:
+        """
+        Removes a finished in-flight request from the single-flight map.
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            task.exception()
+
+    async def _request(
+        self, url: str, params: Dict[str, Any]
+    ) -> NewsResponse:
+        """
+        Performs a GET request against a NewsAPI endpoint and builds the NewsResponse.
+        Large pages are parsed incrementally from the response stream.
+        """
+        try:
+            if _is_large_page(params):
+                async with self._client.stream("GET", url, params=params) as response:
+                    response.raise_for_status()
+                    result = await self._parse_stream(response)
+            else:
+                response = await self._client.get(url, params=params)
                 response.raise_for_status()
-                data = response.json()
-                result = NewsResponse.model_validate(data)
-                return True, result
+                data = orjson.loads(response.content)
+                if self.strict:
+                    result = NewsResponse.model_validate(data)
+                else:
+                    result = _construct_response(data)
+
+            return result
+
+        except httpx.RequestError as e:
+            raise NewsAPIError(f"Request error: {str(e)}") from e
 
-            except httpx.RequestError as e:
-                return False, f"Request error: {str(e)}"
+        except Exception as e:
+            raise NewsAPIError(f"Unexpected error: {str(e)}") from e
+
+    async def _parse_stream(self, response: httpx.Response) -> NewsResponse:
+        """
+        Builds a NewsResponse from a streamed body, creating each Article as soon as
+        its JSON object is complete so the raw payload is never held in memory at once.
+        """
+        status, total_results, articles = None, 0, []
+        builder = None
+
+        events = ijson.parse_async(
+            _AsyncByteReader(response.aiter_bytes()), use_float=True
+        )
+        async for prefix, event, value in events:
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "articles.item" and event == "end_map":
+                    if self.strict:
+                        articles.append(Article.model_validate(builder.value))
+                    else:
+                        articles.append(_construct_article(builder.value))
+                    builder = None
+            elif prefix == "articles.item" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == "status":
+                status = value
+            elif prefix == "totalResults":
+                total_results = value
+
+        if self.strict:
+            return NewsResponse(
+                status=status, totalResults=total_results, articles=articles
+            )
+        return NewsResponse.model_construct(
+            status=status, totalResults=total_results, articles=articles
+        )
+
+
+def _is_large_page(params: Dict[str, Any]) -> bool:
+    """
+    Whether a query asks for a page large enough to be parsed from the response stream.
+    pageSize may be passed as a string, which httpx sends unchanged.
+    """
+    try:
+        return int(params.get("pageSize", 0)) >= _STREAM_PAGE_SIZE
+    except (TypeError, ValueError):
+        return False
 
-            except Exception as e:
-                return False, f"Unexpected error: {str(e)}"
+
+def _cache_key(url: str, keys: FrozenSet[str], params: Dict[str, Any]) -> tuple:
+    """
+    Builds the cache key for a query from the endpoint's known parameters.
+    Falls back to sorting the params when they include an undocumented key.
+    """
+    if params.keys() <= keys:
+        return (url, *(params.get(k) for k in keys))
+    return (url, tuple(sorted(params.items())))
+
+
+class _AsyncByteReader:
+    """
+    Adapts an async byte iterator to the file-like read() interface expected by ijson.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0); don't consume a chunk for it.
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+def _construct_article(article: Dict[str, Any]) -> Article:
+    """
+    Builds an Article from a trusted NewsAPI payload without running validation.
+    publishedAt is still parsed so the field holds the datetime its type declares.
+    """
+    published_at = article.get("publishedAt")
+    return Article.model_construct(
+        **{
+            **article,
+            "source": ArticleSource.model_construct(**article["source"]),
+            "publishedAt": (
+                _DATETIME_ADAPTER.validate_python(published_at)
+                if published_at
+                else None
+            ),
+        }
+    )
+
+
+def _construct_response(data: Dict[str, Any]) -> NewsResponse:
+    """
+    Builds a NewsResponse from a trusted NewsAPI payload without running validation.
+    """
+    articles = [_construct_article(article) for article in data.get("articles", [])]
+    return NewsResponse.model_construct(
+        status=data["status"], totalResults=data["totalResults"], articles=articles
+    )
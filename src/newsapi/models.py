@@ -1,5 +1,5 @@
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict, HttpUrl
+from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
 
@@ -21,8 +21,8 @@ class Article(BaseModel):
     author: str | None
     title: str | None
     description: str | None
-    url: HttpUrl | None
-    url_to_image: HttpUrl | None
+    url: str | None
+    url_to_image: str | None
     published_at: datetime | None
     content: str | None
 
@@ -33,5 +33,6 @@ class NewsResponse(BaseModel):
     model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
     status: str
+    message: str | None = None
     totalResults: int
     articles: list[Article]
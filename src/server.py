@@ -1,16 +1,33 @@
-from datetime import datetime
-from typing import Optional
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
 
+import anyio
 from mcp.server.fastmcp import FastMCP, Context
-from dotenv import load_dotenv
 
-from newsapi.connector import NewsAPIConnector
+from newsapi._validators import VALID_CATEGORY, VALID_SORT, is_valid_date
+from newsapi.connector import NewsAPIConnector, NewsAPIError
 from newsapi.models import NewsResponse
 
-load_dotenv()
 
-mcp = FastMCP("News Server")
-news_api_connector = NewsAPIConnector()
+@dataclass
+class AppContext:
+    """Resources shared by the tools for the lifetime of a server session."""
+
+    news_api_connector: NewsAPIConnector
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
+    """
+    Opens a NewsAPI connector for the session and releases its pooled connections on exit.
+    The MCP server runs the lifespan once per session, so each session gets its own client.
+    """
+    async with NewsAPIConnector() as news_api_connector:
+        yield AppContext(news_api_connector=news_api_connector)
+
+
+mcp = FastMCP("News Server", lifespan=lifespan)
 
 
 @mcp.tool()
@@ -22,7 +39,8 @@ async def fetch_news(
     sort_by: str = "publishedAt",
     page_size: int = 10,
     page: int = 1,
-    ctx: Context = None,
+    *,
+    ctx: Context,
 ) -> NewsResponse:
     """
     Retrieves news articles.
@@ -40,36 +58,34 @@ async def fetch_news(
     Returns:
         News Articles
     """
+    page_size = 100 if page_size > 100 else page_size
+
     if not is_valid_date(from_date):
-        return error_response("Invalid 'from_date' format. Use YYYY-MM-DD.")
+        return _ERR_FROM_DATE
     if not is_valid_date(to_date):
-        return error_response("Invalid 'to_date' format. Use YYYY-MM-DD.")
+        return _ERR_TO_DATE
     if not is_valid_sort_by(sort_by):
-        return error_response(
-            "Invalid 'sort_by' value. Use 'relevancy', 'popularity', 'publishedAt'."
-        )
+        return _ERR_SORT_BY
 
-    if ctx:
-        ctx.info(f"Searching news for: {query}")
+    await ctx.info(f"Searching news for: {query}")
 
     params = {
-        k: v
-        for k, v in {
-            "q": query,
-            "from": from_date,
-            "to": to_date,
-            "language": language,
-            "sortBy": sort_by,
-            "pageSize": min(page_size, 100),
-            "page": page,
-        }.items()
-        if v is not None
+        "q": query,
+        "language": language,
+        "sortBy": sort_by,
+        "pageSize": page_size,
+        "page": page,
     }
+    if from_date is not None:
+        params["from"] = from_date
+    if to_date is not None:
+        params["to"] = to_date
 
-    success, result = await news_api_connector.search_everything(**params)
-    if not success:
-        return error_response("Failed to fetch news articles.")
-    return result
+    news_api_connector = ctx.request_context.lifespan_context.news_api_connector
+    try:
+        return await news_api_connector.search_everything(**params)
+    except NewsAPIError as e:
+        return error_response(str(e))
 
 
 @mcp.tool()
@@ -79,7 +95,8 @@ async def fetch_headlines(
     country: str = "us",
     page_size: int = 10,
     page: int = 1,
-    ctx: Context = None,
+    *,
+    ctx: Context,
 ) -> NewsResponse:
     """
     Retrieves headlines news.
@@ -95,63 +112,38 @@ async def fetch_headlines(
     Returns:
         Top Headlines
     """
-    if category and not is_valid_category(category):
-        return error_response(
-            "Invalid 'category' value. Use 'business', 'entertainment', 'health', 'science', 'sports', or 'technology'."
-        )
-
-    params = {
-        k: v
-        for k, v in {
-            "q": query,
-            "country": country,
-            "category": category,
-            "pageSize": min(page_size, 100),
-            "page": page,
-        }.items()
-        if v is not None
-    }
-
-    success, result = await news_api_connector.get_top_headlines(**params)
-    if not success:
-        return error_response("Failed to fetch headlines.")
-    return result
+    page_size = 100 if page_size > 100 else page_size
 
+    if not is_valid_category(category):
+        return _ERR_CATEGORY
 
-def is_valid_date(date_str: Optional[str]) -> bool:
-    """
-    Validate that a string is in YYYY-MM-DD format.
-    """
-    if date_str is None:
-        return True
+    params = {"pageSize": page_size, "page": page}
+    if query is not None:
+        params["q"] = query
+    if country is not None:
+        params["country"] = country
+    if category is not None:
+        params["category"] = category
 
+    news_api_connector = ctx.request_context.lifespan_context.news_api_connector
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-        return True
-    except ValueError:
-        return False
+        return await news_api_connector.get_top_headlines(**params)
+    except NewsAPIError as e:
+        return error_response(str(e))
 
 
 def is_valid_sort_by(sort_by: str) -> bool:
     """
     Validate that sort_by is one of the allowed values.
     """
-    return sort_by in ["relevancy", "popularity", "publishedAt"]
+    return sort_by in VALID_SORT
 
 
-def is_valid_category(category: str) -> bool:
+def is_valid_category(category: str | None) -> bool:
     """
-    Validate that category is one of the allowed values.
+    Validate that category is either omitted or one of the allowed values.
     """
-    return category in [
-        "business",
-        "entertainment",
-        "general",
-        "health",
-        "science",
-        "sports",
-        "technology",
-    ]
+    return not category or category in VALID_CATEGORY
 
 
 def error_response(message: str) -> NewsResponse:
@@ -161,5 +153,25 @@ def error_response(message: str) -> NewsResponse:
     return NewsResponse(status="error", message=message, articles=[], totalResults=0)
 
 
+_ERR_FROM_DATE = error_response("Invalid 'from_date' format. Use YYYY-MM-DD.")
+_ERR_TO_DATE = error_response("Invalid 'to_date' format. Use YYYY-MM-DD.")
+_ERR_SORT_BY = error_response(
+    "Invalid 'sort_by' value. Use 'relevancy', 'popularity', 'publishedAt'."
+)
+_ERR_CATEGORY = error_response(
+    "Invalid 'category' value. Use 'business', 'entertainment', 'health', 'science', 'sports', or 'technology'."
+)
+
+
 if __name__ == "__main__":
-    mcp.run(transport="stdio")
+    try:
+        import uvloop  # noqa: F401
+
+        backend_options = {"use_uvloop": True}
+    except ImportError:
+        # uvloop is POSIX-only; Windows keeps the default asyncio event loop.
+        backend_options = {}
+
+    # Equivalent to mcp.run(transport="stdio"), with uvloop selected for this run only
+    # rather than installed as the global event loop policy.
+    anyio.run(mcp.run_stdio_async, backend_options=backend_options)
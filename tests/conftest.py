@@ -0,0 +1,9 @@
+import os
+
+from dotenv import load_dotenv
+
+# The newsapi package checks its settings at import time. Load .env first so live
+# integration runs keep their real credentials; offline tests only need placeholders.
+load_dotenv()
+os.environ.setdefault("NEWSAPI_KEY", "test-key")
+os.environ.setdefault("NEWSAPI_URL", "https://newsapi.org/v2/")
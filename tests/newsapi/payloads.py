@@ -0,0 +1,21 @@
+"""Sample NewsAPI payloads shared by the offline tests."""
+
+
+def make_payload(count: int) -> dict:
+    return {
+        "status": "ok",
+        "totalResults": count,
+        "articles": [
+            {
+                "source": {"id": f"source-{i}", "name": f"Source {i}"},
+                "author": f"Author {i}",
+                "title": f"Title {i}",
+                "description": None,
+                "url": f"https://example.com/articles/{i}",
+                "urlToImage": None,
+                "publishedAt": "2024-05-01T10:00:00Z",
+                "content": f"Content {i}",
+            }
+            for i in range(count)
+        ],
+    }
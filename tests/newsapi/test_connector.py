@@ -15,7 +15,7 @@ import pytest
 import pytest_asyncio
 from datetime import datetime, timedelta
 
-from src.newsapi.connector import NewsAPIConnector
+from src.newsapi.connector import NewsAPIConnector, NewsAPIError
 from src.newsapi.models import NewsResponse
 
 
@@ -25,8 +25,8 @@ pytestmark = pytest.mark.live_integration
 
 @pytest_asyncio.fixture
 async def news_api_connector():
-    connector = NewsAPIConnector()
-    yield connector
+    async with NewsAPIConnector() as connector:
+        yield connector
 
 
 @pytest.mark.asyncio
@@ -47,9 +47,8 @@ async def test_search_everything(news_api_connector):
         "page": 1,
     }
 
-    success, result = await news_api_connector.search_everything(**params)
+    result = await news_api_connector.search_everything(**params)
 
-    assert success is True, f"API call failed with error: {result}"
     assert isinstance(result, NewsResponse)
     assert result.status == "ok"
     assert result.totalResults > 0
@@ -77,9 +76,8 @@ async def test_search_everything_with_specific_query(news_api_connector):
         "page": 1,
     }
 
-    success, result = await news_api_connector.search_everything(**params)
+    result = await news_api_connector.search_everything(**params)
 
-    assert success is True, f"API call failed with error: {result}"
     assert isinstance(result, NewsResponse)
     assert result.status == "ok"
 
@@ -105,6 +103,28 @@ async def test_search_everything_with_specific_query(news_api_connector):
             print(f"Description: {article.description[:100]}...")
 
 
+@pytest.mark.asyncio
+async def test_search_everything_paged(news_api_connector):
+    """Test that search_everything_paged merges several pages of results."""
+
+    params = {
+        "q": "technology",
+        "language": "en",
+        "sortBy": "publishedAt",
+        "pageSize": 5,
+    }
+
+    result = await news_api_connector.search_everything_paged(
+        max_results=12, **params
+    )
+
+    assert isinstance(result, NewsResponse)
+    assert result.status == "ok"
+    assert len(result.articles) == min(12, result.totalResults)
+
+    print(f"\nMerged {len(result.articles)} articles across pages")
+
+
 @pytest.mark.asyncio
 async def test_get_top_headlines(news_api_connector):
     """Test get_top_headlines method with a real API call."""
@@ -116,9 +136,8 @@ async def test_get_top_headlines(news_api_connector):
         "page": 1,
     }
 
-    success, result = await news_api_connector.get_top_headlines(**params)
+    result = await news_api_connector.get_top_headlines(**params)
 
-    assert success is True, f"API call failed with error: {result}"
     assert isinstance(result, NewsResponse)
     assert result.status == "ok"
     assert result.totalResults > 0
@@ -133,11 +152,21 @@ async def test_get_top_headlines(news_api_connector):
     print(f"First headline: '{article.title}' from {article.source.name}")
 
 
+@pytest.mark.asyncio
+async def test_client_negotiates_http2(news_api_connector):
+    """Test that the pooled client talks HTTP/2 to NewsAPI."""
+    response = await news_api_connector._client.get(
+        "top-headlines", params={"country": "us", "pageSize": 1}
+    )
+
+    assert response.http_version == "HTTP/2"
+
+
 @pytest.mark.asyncio
 async def test_error_handling_with_invalid_parameters(news_api_connector):
     """Test that the connector handles invalid parameters correctly."""
     # Test with an invalid category
-    success, result = await news_api_connector.get_top_headlines()
+    with pytest.raises(NewsAPIError) as exc_info:
+        await news_api_connector.get_top_headlines()
 
-    assert success is False
-    print(f"\nExpected error received: {result}")
+    print(f"\nExpected error received: {exc_info.value}")
@@ -0,0 +1,206 @@
+"""
+Integration tests for the NewsAPI connector with mocked responses.
+
+Responses are served by httpx.MockTransport, so these tests run offline.
+
+Run with: pytest -m integration
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.newsapi.connector import NewsAPIConnector, NewsAPIError
+from src.newsapi.models import NewsResponse
+from tests.newsapi.payloads import make_payload
+
+
+pytestmark = pytest.mark.integration
+
+
+class MockNewsAPI:
+    """Serves NewsAPI payloads and records the requests it receives."""
+
+    def __init__(self, payload: dict | None = None, status_code: int = 200):
+        self.payload = payload if payload is not None else make_payload(2)
+        self.status_code = status_code
+        self.requests: list[httpx.Request] = []
+        self.entered = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.entered.set()
+        await self.release.wait()
+        return httpx.Response(self.status_code, json=self.payload)
+
+
+async def make_connector(api, strict: bool = False) -> NewsAPIConnector:
+    connector = NewsAPIConnector(strict=strict)
+    await connector._client.aclose()
+    connector._client = httpx.AsyncClient(
+        base_url="https://newsapi.test/v2/", transport=httpx.MockTransport(api)
+    )
+    return connector
+
+
+@pytest_asyncio.fixture
+async def api():
+    return MockNewsAPI()
+
+
+@pytest_asyncio.fixture
+async def news_api_connector(api):
+    async with await make_connector(api) as connector:
+        yield connector
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_request(api, news_api_connector):
+    """Test that concurrent identical queries are served by a single GET."""
+    api.release.clear()
+
+    calls = [
+        asyncio.create_task(news_api_connector.search_everything(q="ai"))
+        for _ in range(3)
+    ]
+    await api.entered.wait()
+    api.release.set()
+    results = await asyncio.gather(*calls)
+
+    assert len(api.requests) == 1
+    assert all(result is results[0] for result in results)
+    assert isinstance(results[0], NewsResponse)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_error():
+    """Test that a failed shared request raises NewsAPIError for every caller."""
+    api = MockNewsAPI(status_code=500)
+    async with await make_connector(api) as connector:
+        api.release.clear()
+        calls = [
+            asyncio.create_task(connector.search_everything(q="ai")) for _ in range(2)
+        ]
+        await api.entered.wait()
+        api.release.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert len(api.requests) == 1
+        assert all(isinstance(result, NewsAPIError) for result in results)
+
+        # Failures are not cached: the next call issues a new request.
+        with pytest.raises(NewsAPIError):
+            await connector.search_everything(q="ai")
+        assert len(api.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_first_caller_keeps_shared_request(api, news_api_connector):
+    """Test that cancelling the caller that started a request does not cancel the others."""
+    api.release.clear()
+
+    owner = asyncio.create_task(news_api_connector.search_everything(q="ai"))
+    await api.entered.wait()
+    waiter = asyncio.create_task(news_api_connector.search_everything(q="ai"))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    api.release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    result = await waiter
+
+    assert isinstance(result, NewsResponse)
+    assert len(api.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_served_from_cache(api, news_api_connector):
+    """Test that a repeated query is answered from the TTL cache unless bypassed."""
+    first = await news_api_connector.get_top_headlines(country="us")
+    second = await news_api_connector.get_top_headlines(country="us")
+    await news_api_connector.get_top_headlines(country="us", use_cache=False)
+
+    assert second is first
+    assert len(api.requests) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("page_size", [60, "60"])
+async def test_large_page_is_streamed(strict, page_size):
+    """Test that streamed pages parse to the same response as the single-shot path."""
+    payload = make_payload(60)
+    api = MockNewsAPI(payload=payload)
+    async with await make_connector(api, strict=strict) as connector:
+        streamed = await connector.search_everything(q="ai", pageSize=page_size)
+        buffered = await connector.search_everything(q="ai", pageSize=10)
+
+    assert api.requests[0].url.params["pageSize"] == "60"
+    assert len(streamed.articles) == 60
+    assert streamed.articles[59].source.name == "Source 59"
+    assert streamed == buffered
+    assert streamed == NewsResponse.model_validate(payload)
+
+
+@pytest.mark.asyncio
+async def test_none_params_are_dropped(api, news_api_connector):
+    """Test that a None parameter is omitted and shares the cache entry of the bare query."""
+    first = await news_api_connector.search_everything(q="ai")
+    second = await news_api_connector.search_everything(q="ai", to=None)
+
+    assert second is first
+    assert len(api.requests) == 1
+    assert "to" not in api.requests[0].url.params
+
+
+@pytest.mark.asyncio
+async def test_list_params_bypass_cache(api, news_api_connector):
+    """Test that list-valued parameters are sent without caching instead of failing."""
+    for _ in range(2):
+        result = await news_api_connector.search_everything(
+            q="ai", sources=["bbc-news", "cnn"]
+        )
+        assert isinstance(result, NewsResponse)
+
+    assert len(api.requests) == 2
+    assert api.requests[0].url.params.get_list("sources") == ["bbc-news", "cnn"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("page_size", [5, "5"])
+async def test_search_everything_paged_merges_pages(page_size):
+    """Test that search_everything_paged fetches and merges the pages it needs."""
+    payload = make_payload(20)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        size = int(request.url.params["pageSize"])
+        articles = payload["articles"][(page - 1) * size : page * size]
+        return httpx.Response(200, json={**payload, "articles": articles})
+
+    async with await make_connector(handler) as connector:
+        result = await connector.search_everything_paged(
+            max_results=12, q="ai", pageSize=page_size
+        )
+
+    assert [a.title for a in result.articles] == [f"Title {i}" for i in range(12)]
+    assert result.totalResults == 20
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("page_size", [0, -1, "abc", None])
+async def test_search_everything_paged_rejects_invalid_page_size(api, page_size):
+    """Test that an invalid pageSize raises NewsAPIError without any request."""
+    async with await make_connector(api) as connector:
+        with pytest.raises(NewsAPIError):
+            await connector.search_everything_paged(
+                max_results=10, q="ai", pageSize=page_size
+            )
+
+    assert api.requests == []
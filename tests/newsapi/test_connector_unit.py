@@ -0,0 +1,43 @@
+"""
+Offline tests for the NewsAPI connector.
+
+These tests never reach newsapi.org: responses are built directly from sample payloads.
+
+Run with: pytest -m unit
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.newsapi.connector import _construct_response
+from src.newsapi.models import NewsResponse
+from tests.newsapi.payloads import make_payload
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_construct_response_matches_validation():
+    """Test that the unvalidated path builds the same models as model_validate."""
+    payload = make_payload(3)
+
+    result = _construct_response(payload)
+
+    assert result == NewsResponse.model_validate(payload)
+    assert isinstance(result.articles[0].published_at, datetime)
+
+
+@pytest.mark.parametrize(
+    "published_at",
+    ["2024-05-01T10:00:00Z", "2024-05-01T10:00:00.123456+02:00", "2024-05-01", None],
+)
+def test_construct_response_parses_timestamps_like_validation(published_at):
+    """Test that publishedAt is parsed exactly as model_validate parses it."""
+    payload = make_payload(1)
+    payload["articles"][0]["publishedAt"] = published_at
+
+    result = _construct_response(payload)
+
+    expected = NewsResponse.model_validate(payload)
+    assert result.articles[0].published_at == expected.articles[0].published_at
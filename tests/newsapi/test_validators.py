@@ -0,0 +1,35 @@
+"""
+Unit tests for the NewsAPI request validators.
+
+Run with: pytest -m unit
+"""
+
+import pytest
+
+from src.newsapi._validators import is_valid_date
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("date_str", [None, "2024-01-01", "2024-12-31"])
+def test_is_valid_date_accepts(date_str):
+    assert is_valid_date(date_str) is True
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "2024-01-01\n",
+        "2024-01-01 ",
+        " 2024-01-01",
+        "٢٠٢٤-٠١-٠١",
+        "2024-1-01",
+        "2024-13-01",
+        "2024-01-32",
+        "2024/01/01",
+        "",
+    ],
+)
+def test_is_valid_date_rejects(date_str):
+    assert is_valid_date(date_str) is False